@@ -4,6 +4,11 @@ from typing import List, Tuple
 import pystac
 
 from ..metadata_links import MetadataLinks, extract_properties
+from .constants import (
+    SENTINEL_SLC_CALIBRATION_DESCRIPTION,
+    SENTINEL_SLC_NOISE_DESCRIPTION,
+    SENTINEL_SLC_PRODUCT_DESCRIPTION,
+)
 
 
 def get_swath_and_polarisation(href: str, upper: bool = True) -> Tuple[str, str]:
@@ -14,6 +19,15 @@ def get_swath_and_polarisation(href: str, upper: bool = True) -> Tuple[str, str]
         return (swath.lower(), polarisation.lower())
 
 
+def swath_and_polarisation_from_key(key: str) -> Tuple[str, str]:
+    """Returns the upper-case swath and polarisation of a schema asset key.
+
+    Keys have the form ``schema-<kind>-<swath>-<polarisation>``.
+    """
+    *_, swath, polarisation = key.split("-")
+    return (swath.upper(), polarisation.upper())
+
+
 class SLCMetadataLinks(MetadataLinks):
     @property
     def annotation_hrefs(self) -> List[Tuple[str, str]]:
@@ -50,14 +64,9 @@ class SLCMetadataLinks(MetadataLinks):
 
     def create_product_asset(self) -> List[Tuple[str, pystac.asset.Asset]]:
         assets = []
-        desc = (
-            "Describes the main characteristics corresponding to the band: state of the "
-            "platform during acquisition, image properties, Doppler information, geographic "
-            "location, etc."
-        )
         for key, href in self.annotation_hrefs:
-            # Extract polarisation from href
-            swath, polarisation = get_swath_and_polarisation(href)
+            # The key already holds the swath and polarisation parsed from href
+            swath, polarisation = swath_and_polarisation_from_key(key)
             if polarisation:
                 # Add polarisation to title
                 title = f"{swath} {polarisation} Product Schema"
@@ -66,21 +75,16 @@ class SLCMetadataLinks(MetadataLinks):
                     media_type=pystac.MediaType.XML,
                     title=title,
                     roles=["metadata"],
-                    description=desc,
+                    description=SENTINEL_SLC_PRODUCT_DESCRIPTION,
                 )
                 assets.append((key, asset))
         return assets
 
     def create_calibration_asset(self) -> List[Tuple[str, pystac.asset.Asset]]:
         assets = []
-        desc = (
-            "Calibration metadata including calibration information and the beta nought, "
-            "sigma nought, gamma and digital number look-up tables that can be used for "
-            "absolute product calibration."
-        )
         for key, href in self.calibration_hrefs:
-            # Extract polarisation from href
-            swath, polarisation = get_swath_and_polarisation(href)
+            # The key already holds the swath and polarisation parsed from href
+            swath, polarisation = swath_and_polarisation_from_key(key)
             if polarisation:
                 # Add polarisation to title
                 title = f"{swath} {polarisation} Calibration Schema"
@@ -89,7 +93,7 @@ class SLCMetadataLinks(MetadataLinks):
                     media_type=pystac.MediaType.XML,
                     title=title,
                     roles=["metadata"],
-                    description=desc,
+                    description=SENTINEL_SLC_CALIBRATION_DESCRIPTION,
                 )
                 assets.append((key, asset))
         return assets
@@ -97,8 +101,8 @@ class SLCMetadataLinks(MetadataLinks):
     def create_noise_asset(self) -> List[Tuple[str, pystac.asset.Asset]]:
         assets = []
         for key, href in self.noise_hrefs:
-            # Extract polarisation from href
-            swath, polarisation = get_swath_and_polarisation(href)
+            # The key already holds the swath and polarisation parsed from href
+            swath, polarisation = swath_and_polarisation_from_key(key)
             if polarisation:
                 # Add polarisation to title
                 title = f"{swath} {polarisation} Noise Schema"
@@ -107,7 +111,7 @@ class SLCMetadataLinks(MetadataLinks):
                     media_type=pystac.MediaType.XML,
                     title=title,
                     roles=["metadata"],
-                    description="Estimated thermal noise look-up tables",
+                    description=SENTINEL_SLC_NOISE_DESCRIPTION,
                 )
                 assets.append((key, asset))
         return assets
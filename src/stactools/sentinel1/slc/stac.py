@@ -1,9 +1,12 @@
+import copy
 import logging
 import os
-from typing import Any, Optional
+from functools import lru_cache
+from itertools import chain
+from typing import Any, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pystac
-import shapely
 from pystac import Summaries
 from pystac.extensions.eo import EOExtension
 from pystac.extensions.item_assets import ItemAssetsExtension
@@ -15,7 +18,6 @@ from stactools.core.projection import transform_from_bbox
 
 from ..bands import image_asset_from_href
 from ..formats import Format
-from ..metadata_links import extract_properties
 from ..product_metadata import get_shape
 from . import constants as c
 from .metadata_links import SLCMetadataLinks
@@ -29,58 +31,117 @@ from .properties import (
 
 logger = logging.getLogger(__name__)
 
+_COLLECTION_EXTENSIONS = (
+    SarExtension.get_schema_uri(),
+    SatExtension.get_schema_uri(),
+    EOExtension.get_schema_uri(),
+)
+
+_ITEM_EXTENSIONS = (
+    SarExtension.get_schema_uri(),
+    SatExtension.get_schema_uri(),
+    EOExtension.get_schema_uri(),
+    ProjectionExtension.get_schema_uri(),
+)
+
+
+def _polygon_centroid(
+    coords: Sequence[Sequence[float]],
+) -> Optional[Tuple[float, float]]:
+    """Returns the area-weighted centroid (x, y) of a closed polygon ring.
+
+    Coordinates are shifted to the first vertex before summing, which keeps
+    the cross products small for footprints far from the origin. Returns None
+    for degenerate (zero-area) rings.
+    """
+    ring = np.asarray(coords, dtype=float)
+    origin = ring[0]
+    x = ring[:, 0] - origin[0]
+    y = ring[:, 1] - origin[1]
+    cross = x[:-1] * y[1:] - x[1:] * y[:-1]
+    area = cross.sum() / 2
+    if area == 0:
+        return None
+    cx = ((x[:-1] + x[1:]) * cross).sum() / (6 * area)
+    cy = ((y[:-1] + y[1:]) * cross).sum() / (6 * area)
+    return float(cx + origin[0]), float(cy + origin[1])
+
+
+def _read_metadata(
+    granule_href: str,
+    read_href_modifier: Optional[ReadHrefModifier],
+    archive_format: Format,
+    **kwargs: Any,
+) -> Tuple[SLCMetadataLinks, SLCProductMetadata]:
+    """Reads the manifest and product metadata of a Sentinel-1 SLC granule."""
+    metalinks = SLCMetadataLinks(
+        granule_href,
+        read_href_modifier,
+        archive_format,
+        **kwargs,
+    )
+
+    product_metadata = SLCProductMetadata(
+        metalinks.product_metadata_href,
+        metalinks.grouped_hrefs,
+        metalinks.map_filename,
+        metalinks.manifest,
+    )
+
+    return metalinks, product_metadata
+
+
+@lru_cache(maxsize=128)
+def _read_cached_metadata(
+    granule_href: str, archive_format: Format
+) -> Tuple[SLCMetadataLinks, SLCProductMetadata]:
+    """Cached :func:`_read_metadata` for granules read without a modifier."""
+    return _read_metadata(granule_href, None, archive_format)
+
+
+def clear_metadata_cache() -> None:
+    """Clears the granule metadata cached by :func:`create_item`.
+
+    Call this when a granule may have changed at the same HREF, e.g. after it
+    was reprocessed or re-uploaded.
+    """
+    _read_cached_metadata.cache_clear()
+
+
+def _summary_list(values: Tuple[Any, ...]) -> List[Any]:
+    """Converts a tuple of summary values, including nested tuples, to lists."""
+    return [list(v) if isinstance(v, tuple) else v for v in values]
+
 
 def create_collection(json_path: str) -> pystac.Collection:
     """Creates a STAC Collection for Sentinel-1 SLC"""
-    # Lists of all possible values for items
+    # Lists of all possible values for items, including the SAR and Satellite
+    # Extension fields (their schema URIs are in _COLLECTION_EXTENSIONS)
     summary_dict = {
         "constellation": [c.SENTINEL_CONSTELLATION],
         "platform": c.SENTINEL_PLATFORMS,
+        **{f"sar:{k}": _summary_list(v) for k, v in c.SENTINEL_SLC_SAR.items()},
+        **{f"sat:{k}": _summary_list(v) for k, v in c.SENTINEL_SLC_SAT.items()},
     }
 
     collection = pystac.Collection(
         id="sentinel1-slc",
         description=c.SENTINEL_SLC_DESCRIPTION,
-        extent=c.SENTINEL_SLC_EXTENT,
+        extent=c.get_slc_extent(),
         title="Sentinel-1 SLC",
         href=json_path,
-        stac_extensions=[
-            SarExtension.get_schema_uri(),
-            SatExtension.get_schema_uri(),
-            EOExtension.get_schema_uri(),
-        ],
+        stac_extensions=list(_COLLECTION_EXTENSIONS),
         keywords=c.SENTINEL_SLC_KEYWORDS,
         providers=[c.SENTINEL_PROVIDER],  # TODO: c.SENTINEL_SLC_PROVIDER
         summaries=Summaries(summary_dict),
     )
 
     # Links
-    collection.links.append(c.SENTINEL_SLC_LICENSE)
-    collection.links.append(c.SENTINEL_SLC_TECHNICAL_GUIDE)
-
-    # SAR Extension
-    sar = SarExtension.summaries(collection, add_if_missing=True)
-    sar.looks_range = c.SENTINEL_SLC_SAR["looks_range"]
-    sar.product_type = c.SENTINEL_SLC_SAR["product_type"]
-    sar.looks_azimuth = c.SENTINEL_SLC_SAR["looks_azimuth"]
-    sar.polarizations = c.SENTINEL_SLC_SAR["polarizations"]
-    sar.frequency_band = c.SENTINEL_SLC_SAR["frequency_band"]
-    sar.instrument_mode = c.SENTINEL_SLC_SAR["instrument_mode"]
-    sar.center_frequency = c.SENTINEL_SLC_SAR["center_frequency"]
-    sar.resolution_range = c.SENTINEL_SLC_SAR["resolution_range"]
-    sar.resolution_azimuth = c.SENTINEL_SLC_SAR["resolution_azimuth"]
-    sar.pixel_spacing_range = c.SENTINEL_SLC_SAR["pixel_spacing_range"]
-    sar.observation_direction = c.SENTINEL_SLC_SAR["observation_direction"]
-    sar.pixel_spacing_azimuth = c.SENTINEL_SLC_SAR["pixel_spacing_azimuth"]
-    sar.looks_equivalent_number = c.SENTINEL_SLC_SAR["looks_equivalent_number"]
-
-    # Satellite Extension
-    sat = SatExtension.summaries(collection, add_if_missing=True)
-    sat.orbit_state = c.SENTINEL_SLC_SAT["orbit_state"]
+    collection.links.extend((c.SENTINEL_SLC_LICENSE, c.SENTINEL_SLC_TECHNICAL_GUIDE))
 
     # Item Asset Extension
     assets = ItemAssetsExtension.ext(collection, add_if_missing=True)
-    assets.item_assets = c.SENTINEL_SLC_ASSETS  # type: ignore
+    assets.item_assets = c.get_slc_assets()  # type: ignore
 
     return collection
 
@@ -93,6 +154,13 @@ def create_item(
 ) -> pystac.Item:
     """Create a STC Item from a Sentinel-1 SLC scene.
 
+    When neither ``read_href_modifier`` nor extra ``kwargs`` are given, the
+    parsed manifest and product metadata of the 128 most recently read granules
+    are cached per process, keyed on ``granule_href`` and ``archive_format``. A
+    granule that changes at the same HREF keeps returning the old metadata until
+    :func:`clear_metadata_cache` is called. Calls with a modifier or extra
+    ``kwargs`` always read the granule.
+
     Args:
         granule_href (str): The HREF to the granule.
             This is expected to be a path to a SAFE archive (see format for other options).
@@ -102,24 +170,20 @@ def create_item(
         archive_format: An enum specifying the format of the granule. Currently supported formats
             are SAFE (default) and COG.
 
-
     Returns:
         pystac.Item: An item representing the Sentinel-1 SLC scene.
     """
 
-    metalinks = SLCMetadataLinks(
-        granule_href,
-        read_href_modifier,
-        archive_format,
-        **kwargs,
-    )
-
-    product_metadata = SLCProductMetadata(
-        metalinks.product_metadata_href,
-        metalinks.grouped_hrefs,
-        metalinks.map_filename,
-        metalinks.manifest,
-    )
+    if read_href_modifier is None and not kwargs:
+        metalinks, product_metadata = _read_cached_metadata(
+            granule_href, archive_format
+        )
+    else:
+        # Modifiers (often per-call signing closures) and extra read options may
+        # be unhashable or hold credentials, so these reads are not cached
+        metalinks, product_metadata = _read_metadata(
+            granule_href, read_href_modifier, archive_format, **kwargs
+        )
 
     scene_id = product_metadata.scene_id
 
@@ -127,41 +191,49 @@ def create_item(
     # at different times will have the same Item ID
     item_id = scene_id[:-5]
 
+    # The product metadata may be cached and shared between calls, so each
+    # item gets its own copy of the footprint
+    geometry = copy.deepcopy(product_metadata.geometry)
     item = pystac.Item(
         id=item_id,
-        geometry=product_metadata.geometry,
-        bbox=product_metadata.bbox,
+        geometry=geometry,
+        bbox=list(product_metadata.bbox),
         datetime=product_metadata.get_datetime,
         properties={},
-        stac_extensions=[],
+        stac_extensions=list(_ITEM_EXTENSIONS),
     )
 
     # ---- Add Extensions ----
+    # The SAR, Sat, EO and Projection schema URIs are set on construction
     # SAR Extension
-    sar = SarExtension.ext(item, add_if_missing=True)
+    sar = SarExtension.ext(item)
     fill_common_sar_properties(sar, metalinks.manifest)
 
     # Satellite Extension
-    sat = SatExtension.ext(item, add_if_missing=True)
+    sat = SatExtension.ext(item)
     fill_sat_properties(sat, metalinks.manifest)
 
-    # eo
-    EOExtension.ext(item, add_if_missing=True)
-
     # processing
     fill_processing_properties(item, metalinks.manifest)
 
     # Projection Extension
-    projection = ProjectionExtension.ext(item, add_if_missing=True)
+    projection = ProjectionExtension.ext(item)
     projection.epsg = 4326
-    projection.bbox = product_metadata.bbox
+    projection.bbox = list(product_metadata.bbox)
     shape = get_shape(metalinks, read_href_modifier, **kwargs)
     projection.shape = shape
     projection.transform = transform_from_bbox(projection.bbox, shape)
-    centroid = shapely.geometry.shape(item.geometry).centroid
+    centroid = None
+    if geometry["type"] == "Polygon":
+        centroid = _polygon_centroid(geometry["coordinates"][0])
+    if centroid is None:
+        import shapely.geometry
+
+        point = shapely.geometry.shape(geometry).centroid
+        centroid = (point.x, point.y)
     projection.centroid = {
-        "lat": round(centroid.y, 5),
-        "lon": round(centroid.x, 5),
+        "lat": round(centroid[1], 5),
+        "lon": round(centroid[0], 5),
     }
 
     # --Common metadata--
@@ -182,33 +254,20 @@ def create_item(
     ):
         item.properties["s1:processing_datetime"] = f"{pdt}Z"
 
-    # Add assets to item
-    item.add_asset(*metalinks.create_manifest_asset())
-
-    # Annotations for bands
-    for asset_obj in metalinks.create_product_asset():
-        item.add_asset(asset_obj[0], asset_obj[1])
-
-    # Calibrations for bands
-    for asset_obj in metalinks.create_calibration_asset():
-        item.add_asset(asset_obj[0], asset_obj[1])
-
-    # Noise for bands
-    for asset_obj in metalinks.create_noise_asset():
-        item.add_asset(asset_obj[0], asset_obj[1])
+    # Add assets to item: manifest, then annotations, calibrations and noise
+    # for bands
+    for key, asset in chain(
+        (metalinks.create_manifest_asset(),),
+        metalinks.create_product_asset(),
+        metalinks.create_calibration_asset(),
+        metalinks.create_noise_asset(),
+    ):
+        item.add_asset(key, asset)
 
     # TODO: RFI assets if newer than 2018
 
     # Thumbnail
     if metalinks.thumbnail_href is not None:
-        desc = (
-            "An averaged, decimated preview image in PNG format. Single polarization "
-            "products are represented with a grey scale image. Dual polarization products "
-            "are represented by a single composite colour image in RGB with the red channel "
-            "(R) representing the  co-polarization VV or HH), the green channel (G) "
-            "represents the cross-polarization (VH or HV) and the blue channel (B) "
-            "represents the ratio of the cross an co-polarizations."
-        )
         item.add_asset(
             "thumbnail",
             pystac.Asset(
@@ -216,7 +275,7 @@ def create_item(
                 media_type=pystac.MediaType.PNG,
                 roles=["thumbnail"],
                 title="Preview Image",
-                description=desc,
+                description=c.SENTINEL_SLC_THUMBNAIL_DESCRIPTION,
             ),
         )
 
@@ -227,28 +286,29 @@ def create_item(
         images_media_type = pystac.MediaType.COG
 
     image_assets = dict(
-        [
-            image_asset_from_href(
-                os.path.join(granule_href, image_path),
-                item,
-                media_type=images_media_type,
-                slc_swaths=True,
-            )
-            for image_path in product_metadata.image_paths
-        ]
+        image_asset_from_href(
+            os.path.join(granule_href, image_path),
+            item,
+            media_type=images_media_type,
+            slc_swaths=True,
+        )
+        for image_path in product_metadata.image_paths
     )
 
-    for asset in image_assets.values():
-        polarisation, swath = extract_properties(asset.href, ["polarisation", "swath"])
-        key = f"{swath}-{polarisation}"
-        assert key not in item.assets
+    assert item.assets.keys().isdisjoint(image_assets)
+
+    for key, asset in image_assets.items():
+        # With slc_swaths, image_asset_from_href keys images as "<swath>-<pol>",
+        # but only for swaths listed in SENTINEL_SLC_SWATHS
+        swath, sep, polarisation = key.partition("-")
+        if not sep:
+            raise ValueError(f"Cannot determine swath of image asset: {asset.href}")
         item.add_asset(key, asset)
-        asset_sar = AssetSarExtension.ext(asset, add_if_missing=True)
+        asset_sar = AssetSarExtension.ext(asset)
 
         fill_swath_sar_properties(asset_sar, swath.upper(), polarisation.upper())
 
     # --Links--
-    item.links.append(c.SENTINEL_SLC_LICENSE)
-    item.links.append(c.SENTINEL_SLC_TECHNICAL_GUIDE)
+    item.links.extend((c.SENTINEL_SLC_LICENSE, c.SENTINEL_SLC_TECHNICAL_GUIDE))
 
     return item
@@ -1,6 +1,10 @@
+from dataclasses import dataclass
 from itertools import product
+from unittest.mock import patch
 
 import pystac
+import pytest
+import shapely
 from pystac.extensions.eo import EOExtension
 from pystac.utils import is_absolute_href
 
@@ -96,3 +100,64 @@ def test_create_item() -> None:
     assert (
         item.properties.get("s1:processing_datetime") == "2014-10-31T20:34:21.000000Z"
     )
+
+
+def test_create_item_reuses_granule_metadata() -> None:
+    granule_href = test_data.get_path(
+        "data-files/slc/S1A_IW_SL1__1_SH_20141031T095929_20141031T100002_003072_003842_91FC.SAFE"  # noqa
+    )
+    stac.clear_metadata_cache()
+    with patch.object(
+        stac, "SLCMetadataLinks", wraps=stac.SLCMetadataLinks
+    ) as metalinks:
+        first = stac.create_item(granule_href, archive_format=Format.SAFE)
+        second = stac.create_item(granule_href, archive_format=Format.SAFE)
+        assert metalinks.call_count == 1
+        assert first.to_dict() == second.to_dict()
+
+        # Items built from cached metadata must not share mutable state
+        expected = second.to_dict()
+        assert first.bbox is not None and first.geometry is not None
+        first.bbox[0] = 999.0
+        first.geometry["type"] = "Point"
+        third = stac.create_item(granule_href, archive_format=Format.SAFE)
+        assert second.to_dict() == expected
+        assert third.to_dict() == expected
+
+        stac.clear_metadata_cache()
+        stac.create_item(granule_href, archive_format=Format.SAFE)
+        assert metalinks.call_count == 2
+
+
+@dataclass
+class Signer:
+    token: str
+
+    def __call__(self, href: str) -> str:
+        return href
+
+
+def test_create_item_with_read_href_modifier_is_not_cached() -> None:
+    granule_href = test_data.get_path(
+        "data-files/slc/S1A_IW_SL1__1_SH_20141031T095929_20141031T100002_003072_003842_91FC.SAFE"  # noqa
+    )
+    signer = Signer("token")  # dataclasses are unhashable
+    with patch.object(
+        stac, "SLCMetadataLinks", wraps=stac.SLCMetadataLinks
+    ) as metalinks:
+        first = stac.create_item(granule_href, signer, archive_format=Format.SAFE)
+        second = stac.create_item(granule_href, signer, archive_format=Format.SAFE)
+        assert metalinks.call_count == 2
+    assert first.to_dict() == second.to_dict()
+
+
+def test_polygon_centroid_matches_shapely() -> None:
+    ring = [(-53.6, 69.5), (-45.8, 69.9), (-46.2, 71.7), (-53.1, 71.4), (-53.6, 69.5)]
+    expected = shapely.geometry.Polygon(ring).centroid
+    centroid = stac._polygon_centroid(ring)
+    assert centroid is not None
+    assert centroid == pytest.approx((expected.x, expected.y))
+
+
+def test_polygon_centroid_degenerate() -> None:
+    assert stac._polygon_centroid([(0, 0), (1, 1), (2, 2), (0, 0)]) is None